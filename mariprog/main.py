@@ -10,79 +10,66 @@ Requires:
 """
 import csv
 import datetime
+import io
 import re
+import sys
+from collections import Counter
 from dataclasses import dataclass
 from datetime import date
-from typing import List
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter
+from typing import List, NamedTuple
 
 from dateutil.relativedelta import *
 
-inspections_in_programme = []
-presentable_inspections = []
-LIST_OF_PORTS = []
-INITIALS = ["KS", "PN", "SP", "ML", "SC", "DS", "WW", "GE", "TL", "PD", "AO"]
-WEEKS = []
-DATE_PATTERN = re.compile("^\d{1,2}\/\d{1,2}\/\d{2,4}$")
+INITIALS = frozenset(("KS", "PN", "SP", "ML", "SC", "DS", "WW", "GE", "TL", "PD", "AO"))
+DATE_PATTERN = re.compile(r"^\d{1,2}/\d{1,2}/\d{2,4}$")
 
 
 def parse_programme_date(date_string):
-    dstring = date_string.split("/")
-    return date.fromisoformat(
-        "-".join([_convert_year_str(dstring[2]), dstring[1], dstring[0]])
-    )
-
-
-def _convert_year_str(year_str):
-    if len(year_str) == 2:
-        return f"20{year_str}"
-    elif len(year_str) == 4:
-        return year_str
-    else:
-        return year_str
+    day, month, year = date_string.split("/")
+    if len(year) == 2:
+        year = f"20{year}"
+    return date(int(year), int(month), int(day))
 
 
 class Inspection:
-    def __init__(self, week_begining, inspection_data):
-        self._inspection_data = inspection_data
+    __slots__ = ("week_begining", "facility", "location", "comments", "inspectors")
+
+    def __init__(self, week_begining, key, row):
         self.week_begining = parse_programme_date(week_begining)
+        self.facility = ""
+        self.location = ""
+        self.comments = ""
+        inspectors = []
+        for k, v in zip(key, row):
+            if k == "Facility":
+                self.facility = v.rstrip()
+            elif k == "Location":
+                self.location = v
+            elif k == "Comments/Date":
+                self.comments = v.rstrip()
+            elif v == "X" and k in INITIALS:
+                inspectors.append(k)
+        self.inspectors = inspectors
 
     def __repr__(self):
-        return [item[1] for item in self._inspection_data if item[0] == "Facility"][0]
-
-    @property
-    def facility(self):
-        return [item[1] for item in self._inspection_data if item[0] == "Facility"][0]
-
-    @property
-    def location(self):
-        return [item[1] for item in self._inspection_data if item[0] == "Location"][0]
-
-    @property
-    def inspectors(self):
-        return [
-            item[0]
-            for item in self._inspection_data
-            if item[1] == "X" and item[0] in INITIALS
-        ]
-
-    @property
-    def comments(self):
-        return [
-            item[1] for item in self._inspection_data if item[0] == "Comments/Date"
-        ][0]
-
-
-
-
-def _get_header_key_from_csv(opened_csv):
-    reader = csv.reader(opened_csv)
-    for row in reader:
-        if row[0] == "Week Comm":
-            return row
+        return self.facility
 
 
 @dataclass
 class PresentableInspection:
+    __slots__ = (
+        "week_begining",
+        "location",
+        "facility",
+        "inspectors",
+        "comments",
+        "pfsa_expiry",
+        "pfsa_approval",
+    )
+
     week_begining: str
     location: str
     facility: str
@@ -94,6 +81,18 @@ class PresentableInspection:
 
 @dataclass
 class PSAMeeting:
+    __slots__ = (
+        "psa",
+        "date",
+        "pso",
+        "comments",
+        "comments_from_meeting",
+        "inspectors",
+        "psp_reviewed",
+        "psra_reviewed",
+        "minutes_held",
+    )
+
     psa: str
     date: datetime.datetime
     pso: str
@@ -105,236 +104,318 @@ class PSAMeeting:
     minutes_held: bool
 
 
+_BOOL_MAP = {s: True for s in ("TRUE", "True", "true", "YES", "yes", "Yes")}
+_BOOL_MAP.update({s: False for s in ("FALSE", "False", "false", "No", "NO", "no")})
+
+
 def _convert_str_to_bool(bstr):
-    if bstr in ["TRUE", "True", "true", "YES", "yes", "Yes"]:
-        return True
-    elif bstr in ["FALSE", "False", "false", "No", "NO", "no"]:
-        return False
-    else:
-        raise ValueError("Cannot recognise {bstr}".format(bst))
+    try:
+        return _BOOL_MAP[bstr]
+    except KeyError:
+        raise ValueError(f"Cannot recognise {bstr}") from None
 
 
+@lru_cache(maxsize=None)
 def _convert_datetime_str_to_datetime(dstr):
     "Must be of the form 14-05-2014 11:00"
     if not dstr:
         return ""
-    year = int(dstr.split()[0].split("-")[2])
-    month = int(dstr.split()[0].split("-")[1])
-    day = int(dstr.split()[0].split("-")[0])
-    hour = int(dstr.split()[1].split(":")[0])
-    minute = int(dstr.split()[1].split(":")[1])
-    return datetime.datetime(year, month, day, hour, minute)
+    d, t = dstr.split()
+    day, month, year = d.split("-")
+    hour, minute = t.split(":")
+    return datetime.datetime(int(year), int(month), int(day), int(hour), int(minute))
+
+
+def _column_indices(header, *names):
+    "Positions of the named columns in a csv header row."
+    return [header.index(name) for name in names]
 
 
 def psa_meetings(csv_file) -> List[PSAMeeting]:
     psa_meetings_lst = []
     with open(csv_file, "r", encoding="ISO-8859-1") as csvfile:
-        csv_reader = csv.DictReader(csvfile)
+        csv_reader = csv.reader(csvfile)
+        (
+            i_name,
+            i_date,
+            i_pso,
+            i_comments,
+            i_comments_from_meeting,
+            i_inspectors,
+            i_psp,
+            i_psra,
+            i_minutes,
+        ) = _column_indices(
+            next(csv_reader),
+            "PSA_Name",
+            "MeetingDate",
+            "PSO",
+            "Comments",
+            "CommentsFromMeeting",
+            "Inspectors",
+            "PSPReviewed",
+            "PSRAReviewed",
+            "MinutesHeld",
+        )
         for row in csv_reader:
+            if not row:
+                continue
             psa_meeting = PSAMeeting(
-                row["PSA_Name"],
-                _convert_datetime_str_to_datetime(row["MeetingDate"]),
-                row["PSO"],
-                row["Comments"],
-                row["CommentsFromMeeting"],
-                row["Inspectors"],
-                _convert_str_to_bool(row["PSPReviewed"]),
-                _convert_str_to_bool(row["PSRAReviewed"]),
-                _convert_str_to_bool(row["MinutesHeld"])
+                row[i_name],
+                _convert_datetime_str_to_datetime(row[i_date]),
+                row[i_pso],
+                row[i_comments],
+                row[i_comments_from_meeting],
+                row[i_inspectors],
+                _convert_str_to_bool(row[i_psp]),
+                _convert_str_to_bool(row[i_psra]),
+                _convert_str_to_bool(row[i_minutes])
             )
             psa_meetings_lst.append(psa_meeting)
     return psa_meetings_lst
 
 
+def _write_lines(lines):
+    "Write lines to stdout in a single call."
+    if lines:
+        sys.stdout.write("\n".join(lines))
+        sys.stdout.write("\n")
+
+
 def parse_programme(csv_file):
     """
     Parses the current programme spreadsheet.
+
+    Returns the inspections, their presentable form and the weeks found.
     """
     current_week = ""
+    inspections_in_programme = []
+    presentable_inspections = []
+    weeks = []
 
-    pfsa_expiry_data_lst = list(parse_pfsa_csv("pfsa.csv"))
+    pfsa_expiry_data_lst = parse_pfsa_csv("pfsa.csv")
+    pfsa_index = {p.site_name: p for p in pfsa_expiry_data_lst}
 
-    with open(csv_file, "r", encoding="ISO-8859-1") as csvfile:
-        csv_reader = csv.reader(csvfile)
-        key = _get_header_key_from_csv(csvfile)
-        for row in csv_reader:
-            if re.match(DATE_PATTERN, row[0]):
-                WEEKS.append(parse_programme_date(row[0]))
-                inspection = Inspection(row[0], list(zip(key, row)))
-                current_week = row[0]
-                inspections_in_programme.append(inspection)
-            elif row[0] == "":
-                inspection = Inspection(current_week, list(zip(key, row)))
-                inspections_in_programme.append(inspection)
-
-        for inspection in inspections_in_programme:
-            try:
-                pfsa_expiry_entry = [x for x in pfsa_expiry_data_lst if x.site_name == inspection.facility.rstrip()][0]
-                _pfsa_exp = pfsa_expiry_entry.pfsa_expiry_date
-                _pfsa_apr = pfsa_expiry_entry.pfsa_approval_date
-            except IndexError:
-                _pfsa_exp = "NO PFSA EXPIRY DATA"
-            pi = PresentableInspection(
-                inspection.week_begining,
-                inspection.location,
-                inspection.facility,
-                '|'.join(inspection.inspectors),
-                inspection.comments.rstrip(),
-                _pfsa_exp,
-                _pfsa_apr
-            )
-            presentable_inspections.append(pi)
-        for inspection in presentable_inspections:
-            print(
-                inspection.week_begining,
-                f"{inspection.location:<10}",
-                f"{inspection.facility:<50}",
-                f"{inspection.inspectors:<10}",
-                f"{inspection.comments:<40}",
-                f"{inspection.pfsa_approval}",
-                f"{inspection.pfsa_expiry}"
-            )
+    with open(csv_file, "r", encoding="ISO-8859-1", newline="") as csvfile:
+        rows = list(csv.reader(csvfile))
+    header_idx = next(
+        (i for i, row in enumerate(rows) if row and row[0] == "Week Comm"), None
+    )
+    if header_idx is None:
+        raise ValueError(f"No 'Week Comm' header row in {csv_file}")
+    key = rows[header_idx]
+    for row in islice(rows, header_idx + 1, None):
+        first = row[0]
+        if first and first[0].isdigit() and DATE_PATTERN.match(first):
+            weeks.append(parse_programme_date(first))
+            inspection = Inspection(first, key, row)
+            current_week = first
+            inspections_in_programme.append(inspection)
+        elif first == "":
+            inspection = Inspection(current_week, key, row)
+            inspections_in_programme.append(inspection)
+
+    lines = []
+    for inspection in inspections_in_programme:
+        pfsa_expiry_entry = pfsa_index.get(inspection.facility)
+        if pfsa_expiry_entry is None:
+            _pfsa_exp = "NO PFSA EXPIRY DATA"
+            _pfsa_apr = ""
+        else:
+            _pfsa_exp = pfsa_expiry_entry.pfsa_expiry_date
+            _pfsa_apr = pfsa_expiry_entry.pfsa_approval_date
+        pi = PresentableInspection(
+            inspection.week_begining,
+            inspection.location,
+            inspection.facility,
+            '|'.join(inspection.inspectors),
+            inspection.comments,
+            _pfsa_exp,
+            _pfsa_apr
+        )
+        presentable_inspections.append(pi)
+        lines.append(
+            f"{pi.week_begining} {pi.location:<10} {pi.facility:<50} "
+            f"{pi.inspectors:<10} {pi.comments:<40} {pi.pfsa_approval} {pi.pfsa_expiry}"
+        )
+    _write_lines(lines)
+    return inspections_in_programme, presentable_inspections, weeks
 
 
-class PortFromPFSARow:
-    def __init__(self, row):
-        self.site_name = row["SiteName"].strip()
-        self.pfsa_approval_date = self.parse_date_string(row["PFSA Approval"])
-        self.pfsa_expiry_date = self.parse_date_string(row["PFSA Expiry"])
+def facility_weeks(inspections):
+    "Weeks in which each facility appears in the programme."
+    weeks = {}
+    for inspection in inspections:
+        weeks.setdefault(inspection.facility, []).append(inspection.week_begining)
+    return weeks
 
-    def parse_date_string(self, date_string):
-        try:
-            dstring = date_string.split()[0]
-        except IndexError:
-            return date(1900, 1, 1)
-        year = dstring.split("-")[2]
-        month = dstring.split("-")[1]
-        day = dstring.split("-")[0]
-        return date.fromisoformat("-".join([year, month, day]))
 
+@lru_cache(maxsize=None)
+def _parse_date_string(date_string):
+    "Must be of the form 14-05-2014, optionally followed by a time."
+    try:
+        dstring = date_string.split()[0]
+    except IndexError:
+        return date(1900, 1, 1)
+    day, month, year = dstring.split("-")
+    return date(int(year), int(month), int(day))
 
-def parse_pfsa_csv(csv_file):
-    "Parses the csv containing PFSA expiry data."
-    list_of_ports = []
+
+class PortFromPFSARow(NamedTuple):
+    site_name: str
+    pfsa_approval_date: datetime.date
+    pfsa_expiry_date: datetime.date
+
+
+def _open_csv(csv_file):
+    """
+    Reads csv_file once, decoding as utf-8 and falling back to ISO-8859-1
+    if that fails (the file was made on Windoze).
+    """
+    with open(csv_file, "rb") as f:
+        raw = f.read()
     try:
-        with open(csv_file, "r", encoding="utf-8") as csvfile:
-            reader = csv.DictReader(csvfile)
-            for row in reader:
-                port = PortFromPFSARow(row)
-                list_of_ports.append(port)
+        text = raw.decode("utf-8")
     except UnicodeDecodeError:
-        # the file was made on Windoze
-        with open(csv_file, "r", encoding="ISO-8859-1") as csvfile:
-            reader = csv.DictReader(csvfile)
-            for row in reader:
-                port = PortFromPFSARow(row)
-                list_of_ports.append(port)
-    return sorted(list_of_ports, key=lambda x: x.pfsa_expiry_date)
-
-
-
-class PortFromCSVRow:
-    def __init__(self, row):
-        self.site_name = row["SiteName"].strip()
-        try:
-            self.county = row["County"].strip()
-        except KeyError:
-            pass
-        self.last_inspection_date = self.parse_date_string(row["DateOfLastInspection"])
-        self.frequency_target = (
-            row["FrequencyTarget"].strip() if row["FrequencyTarget"] else "XXXXX"
+        text = raw.decode("ISO-8859-1")
+    return io.StringIO(text, newline="")
+
+
+@lru_cache(maxsize=None)
+def parse_pfsa_csv(csv_file):
+    "Parses the csv containing PFSA expiry data."
+    with _open_csv(csv_file) as csvfile:
+        reader = csv.reader(csvfile)
+        i_name, i_approval, i_expiry = _column_indices(
+            next(reader), "SiteName", "PFSA Approval", "PFSA Expiry"
         )
-        self.pfsi_category = row["SubCategoryDesc"].strip()
-        self.site_category = row["SiteCategoryDesc"].strip()
-
-    def parse_date_string(self, date_string):
-        try:
-            dstring = date_string.split()[0]
-        except IndexError:
-            return date(1900, 1, 1)
-        year = dstring.split("-")[2]
-        month = dstring.split("-")[1]
-        day = dstring.split("-")[0]
-        return date.fromisoformat("-".join([year, month, day]))
+        list_of_ports = [
+            PortFromPFSARow(
+                row[i_name].strip(),
+                _parse_date_string(row[i_approval]),
+                _parse_date_string(row[i_expiry]),
+            )
+            for row in reader
+            if row
+        ]
+    return tuple(sorted(list_of_ports, key=attrgetter("pfsa_expiry_date")))
+
+
+
+class PortFromCSVRow(NamedTuple):
+    site_name: str
+    county: str
+    last_inspection_date: datetime.date
+    frequency_target: str
+    pfsi_category: str
+    site_category: str
 
     def __repr__(self):
         return f"{self.site_name}: {self.pfsi_category}"
 
 
 
+@lru_cache(maxsize=None)
 def parse_csv(csv_file):
     """
-    Parses the csv file.
+    Parses the csv file, returning the sites that are Ports.
     """
-    try:
-        with open(csv_file, "r", encoding="utf-8") as csvfile:
-            csv_reader = csv.DictReader(csvfile)
-            for row in csv_reader:
-                port = PortFromCSVRow(row)
-                if row["SiteTypeDesc"] == "Port":
-                    LIST_OF_PORTS.append(port)
-    except UnicodeDecodeError:
-        # the file was made on Windoze
-        with open(csv_file, "r", encoding="ISO-8859-1") as csvfile:
-            csv_reader = csv.DictReader(csvfile)
-            for row in csv_reader:
-                port = PortFromCSVRow(row)
-                if row["SiteTypeDesc"] == "Port":
-                    LIST_OF_PORTS.append(port)
+    with _open_csv(csv_file) as csvfile:
+        csv_reader = csv.reader(csvfile)
+        header = next(csv_reader)
+        (
+            i_name,
+            i_last_inspection,
+            i_frequency,
+            i_pfsi_category,
+            i_site_category,
+            i_site_type,
+        ) = _column_indices(
+            header,
+            "SiteName",
+            "DateOfLastInspection",
+            "FrequencyTarget",
+            "SubCategoryDesc",
+            "SiteCategoryDesc",
+            "SiteTypeDesc",
+        )
+        i_county = header.index("County") if "County" in header else None
+        ports = []
+        for row in csv_reader:
+            if not row or row[i_site_type] != "Port":
+                continue
+            port = PortFromCSVRow(
+                row[i_name].strip(),
+                row[i_county].strip() if i_county is not None else "",
+                _parse_date_string(row[i_last_inspection]),
+                row[i_frequency].strip() if row[i_frequency] else "XXXXX",
+                row[i_pfsi_category].strip(),
+                row[i_site_category].strip(),
+            )
+            ports.append(port)
+    return tuple(ports)
 
 
 def print_site_data_to_terminal(filename):
-    parse_csv(filename)
-    sorted_list = sorted(LIST_OF_PORTS, key=lambda port: port.last_inspection_date)
-    for port in sorted_list:
-        print(
+    sorted_list = sorted(parse_csv(filename), key=attrgetter("last_inspection_date"))
+    _write_lines(
+        [
             f"{port.site_name:<60} --- {port.county:<20} {port.pfsi_category:<10} {port.site_category:<10} {port.frequency_target:<5} {port.last_inspection_date}"
-        )
+            for port in sorted_list
+        ]
+    )
 
 
 # TODO check this
-def week_port_is_in_programme(port):
-    for p in LIST_OF_PORTS:
-        if p.site_name == port:
-            for inspection in inspections_in_programme:
-                if port == inspection.facility:
-                    print(port, inspection.week_begining)
+def week_port_is_in_programme(port, port_names, weeks_by_facility):
+    if port in port_names:
+        for week in weeks_by_facility.get(port, ()):
+            print(port, week)
 
 
-def count_inspections_for_inspector(initials):
-    count = 0
-    for inspection in inspections_in_programme:
-        if initials in inspection.inspectors:
-            count += 1
-    return count
+def inspector_counts(inspections):
+    "Number of programmed inspections per inspector, in one pass."
+    counts = Counter()
+    for inspection in inspections:
+        counts.update(inspection.inspectors)
+    return counts
+
 
+def count_inspections_for_inspector(initials, inspections):
+    return inspector_counts(inspections)[initials]
 
-def calculate_port_within_allowed_period(port):
+
+def calculate_port_within_allowed_period(port, weeks_by_facility):
     ft = int(port.frequency_target)
     last_insp = port.last_inspection_date
     calc = last_insp + relativedelta(months=+ft)
-    in_prog = in_current_programme(port)
+    in_prog = in_current_programme(port, weeks_by_facility)
     print(f"{port.site_name:<60} -- Next inspection due: {calc} - {in_prog}.")
 
 
-def in_current_programme(port):
-    for p in inspections_in_programme:
-        if p.facility == port.site_name:
-            return (True, p.week_begining)
-        else:
-            continue
+def in_current_programme(port, weeks_by_facility):
+    weeks = weeks_by_facility.get(port.site_name)
+    if weeks:
+        return (True, weeks[0])
     return False
 
 
-def print_port_inspection_expiry():
-    for port in LIST_OF_PORTS:
-        calculate_port_within_allowed_period(port)
+def print_port_inspection_expiry(ports, inspections):
+    weeks_by_facility = facility_weeks(inspections)
+    for port in ports:
+        calculate_port_within_allowed_period(port, weeks_by_facility)
+
+
+@lru_cache(maxsize=None)
+def _load_psa_meetings(csv_file):
+    "Parsed meetings for csv_file, read from disk only once."
+    return tuple(psa_meetings(csv_file))
 
 
 def print_psa_meetings_from_date(date: datetime.date, comments=False):
-    meetings = psa_meetings("psa_meetings.csv")
+    meetings = _load_psa_meetings("psa_meetings.csv")
 #   today = datetime.datetime.today()
-    after_date = sorted([m for m in meetings if m.date > date], key=lambda x: x.date)
+    after_date = sorted((m for m in meetings if m.date > date), key=attrgetter("date"))
     for m in after_date:
         if comments:
             print(m.date, f"{m.psa:<20}", m.comments)
@@ -344,6 +425,14 @@ def print_psa_meetings_from_date(date: datetime.date, comments=False):
 
 @dataclass
 class PSAData:
+    __slots__ = (
+        "psa",
+        "pso",
+        "psa_approval_date",
+        "date_of_last_inspection",
+        "due_inspection",
+    )
+
     psa: str
     pso: str
     psa_approval_date: datetime.datetime
@@ -354,29 +443,39 @@ class PSAData:
 def get_psa_assessment_data(csv_file):
     output = []
     with open(csv_file, "r", encoding="ISO-8859-1") as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+        i_name, i_pso, i_approval, i_last, i_due, i_site_type = _column_indices(
+            next(reader),
+            "SiteName",
+            "PSO",
+            "PortSecurityAssessmentApprovalDate",
+            "DateOfLastInspection",
+            "DateInspectionDue",
+            "SiteTypeDesc",
+        )
         for row in reader:
-            if row["SiteTypeDesc"] == "PSA":
-                psa = PSAData(
-                    row["SiteName"],
-                    row["PSO"],
-                    _convert_datetime_str_to_datetime(row["PortSecurityAssessmentApprovalDate"]),
-                    _convert_datetime_str_to_datetime(row["DateOfLastInspection"]),
-                    _convert_datetime_str_to_datetime(row["DateInspectionDue"])
-                )
-                output.append(psa)
+            if not row or row[i_site_type] != "PSA":
+                continue
+            psa = PSAData(
+                row[i_name],
+                row[i_pso],
+                _convert_datetime_str_to_datetime(row[i_approval]),
+                _convert_datetime_str_to_datetime(row[i_last]),
+                _convert_datetime_str_to_datetime(row[i_due])
+            )
+            output.append(psa)
     return output
 
 
 
 def print_psa_assessment_data():
-    psa_assessment_data = sorted(get_psa_assessment_data("psa_aid.csv"), key=lambda x: x.due_inspection)
-    for psa in psa_assessment_data:
-        print(
-            f"{psa.psa:<32}",
-            f"{psa.pso:<30}",
-            f"due: {psa.due_inspection}"
-        )
+    psa_assessment_data = sorted(get_psa_assessment_data("psa_aid.csv"), key=attrgetter("due_inspection"))
+    _write_lines(
+        [
+            f"{psa.psa:<32} {psa.pso:<30} due: {psa.due_inspection}"
+            for psa in psa_assessment_data
+        ]
+    )
 
 
 
@@ -386,17 +485,18 @@ def main():
     """
     print_psa_assessment_data()
 #   print_psa_meetings_from_date(datetime.datetime(2019, 1, 1, 0, 0), comments=False)
-#   parse_programme("programme.csv")
+#   inspections, _, _ = parse_programme("programme.csv")
 #   print_site_data_to_terminal("dump.csv")
-#   print_port_inspection_expiry()
-#   print("ML: ", count_inspections_for_inspector("ML"))
-#   print("WW: ", count_inspections_for_inspector("WW"))
-#   print("TL: ", count_inspections_for_inspector("TL"))
-#   print("GE: ", count_inspections_for_inspector("GE"))
-#   print("KS: ", count_inspections_for_inspector("KS"))
-#   print("PN: ", count_inspections_for_inspector("PN"))
-#   print("SC: ", count_inspections_for_inspector("SC"))
-#   print("SP: ", count_inspections_for_inspector("SP"))
+#   print_port_inspection_expiry(parse_csv("dump.csv"), inspections)
+#   counts = inspector_counts(inspections)
+#   print("ML: ", counts["ML"])
+#   print("WW: ", counts["WW"])
+#   print("TL: ", counts["TL"])
+#   print("GE: ", counts["GE"])
+#   print("KS: ", counts["KS"])
+#   print("PN: ", counts["PN"])
+#   print("SC: ", counts["SC"])
+#   print("SP: ", counts["SP"])
 
 
 if __name__ == "__main__":